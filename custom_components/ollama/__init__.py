@@ -4,14 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from types import MappingProxyType
+import time
 
 import httpx
 import ollama
 
+try:
+    import brotli  # noqa: F401
+
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
 from homeassistant.config_entries import ConfigEntry, ConfigSubentry
-from homeassistant.const import CONF_URL, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_URL, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import (
     config_validation as cv,
@@ -34,6 +41,8 @@ from .const import (
     CONF_WEB_SEARCH_ENABLED,
     DEFAULT_AI_TASK_NAME,
     DEFAULT_NAME,
+    DEFAULT_SEARCH_PROVIDER,
+    DEFAULT_SEARCH_URL,
     DEFAULT_TIMEOUT,
     DOMAIN,
 )
@@ -57,6 +66,31 @@ __all__ = [
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 PLATFORMS = (Platform.AI_TASK, Platform.CONVERSATION)
+_PLATFORM_SUBENTRY_TYPES = {
+    Platform.AI_TASK: "ai_task_data",
+    Platform.CONVERSATION: "conversation",
+}
+
+# Connection pool tuning for the shared httpx transport backing the Ollama
+# client. The client lives for the lifetime of the config entry, so keep-alive
+# connections and HTTP/2 multiplexing are reused across conversation turns
+# instead of paying a TCP/TLS handshake per request.
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=40,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+# Bound connection establishment only; streaming chat responses must not be
+# cut off by a read timeout.
+_CLIENT_TIMEOUT = httpx.Timeout(None, connect=10.0)
+
+# How long a successful server health check stays valid, so options-update
+# reload storms don't re-ping a server that just answered
+_HEALTH_CHECK_INTERVAL = 60  # seconds
+
+# Negotiate compressed responses for the streaming JSON frames; only
+# advertise brotli when a decoder is installed
+_CLIENT_HEADERS = {"Accept-Encoding": "gzip, br" if HAS_BROTLI else "gzip"}
 
 type OllamaConfigEntry = ConfigEntry[ollama.AsyncClient]
 
@@ -66,18 +100,84 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+def _async_get_client(hass: HomeAssistant, url: str) -> ollama.AsyncClient:
+    """Get or create the shared client for a server URL.
+
+    Options updates reload the entry; keeping the client (and its TCP pool)
+    in hass.data keyed by URL avoids rebuilding connections on every reload
+    and sidesteps stale-pool errors when an entry is torn down and set up
+    again. Clients are refcounted so the pool is only closed once no entry
+    references the URL anymore, and on Home Assistant shutdown.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    clients: dict[str, ollama.AsyncClient] = domain_data.setdefault("clients", {})
+    refs: dict[str, int] = domain_data.setdefault("client_refs", {})
+
+    if (client := clients.get(url)) is None:
+        client = ollama.AsyncClient(
+            host=url,
+            verify=get_default_context(),
+            http2=True,
+            limits=_CLIENT_LIMITS,
+            timeout=_CLIENT_TIMEOUT,
+            headers=_CLIENT_HEADERS,
+        )
+        clients[url] = client
+
+        async def _async_close_client(_: Event) -> None:
+            await client._client.aclose()  # noqa: SLF001
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_client)
+
+    refs[url] = refs.get(url, 0) + 1
+    return client
+
+
+def _async_release_client(hass: HomeAssistant, url: str) -> None:
+    """Release a reference to a shared client.
+
+    The pool itself stays warm: an options-update reload unloads and sets the
+    entry right back up, so closing here would defeat the cache. Unreferenced
+    pools are closed when their entry is removed or on shutdown.
+    """
+    refs: dict[str, int] = hass.data.get(DOMAIN, {}).get("client_refs", {})
+    if url in refs:
+        refs[url] -= 1
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: OllamaConfigEntry) -> bool:
     """Set up Ollama Enhanced from a config entry."""
     settings = {**entry.data, **entry.options}
-    client = ollama.AsyncClient(host=settings[CONF_URL], verify=get_default_context())
-    try:
-        async with asyncio.timeout(DEFAULT_TIMEOUT):
-            await client.list()
-    except (TimeoutError, httpx.ConnectError) as err:
-        raise ConfigEntryNotReady(err) from err
+    client = _async_get_client(hass, settings[CONF_URL])
+    health_cache = hass.data.setdefault(DOMAIN, {}).setdefault("health", {})
+    last_success = health_cache.get(settings[CONF_URL])
+    if last_success is None or time.monotonic() - last_success > _HEALTH_CHECK_INTERVAL:
+        try:
+            async with asyncio.timeout(DEFAULT_TIMEOUT):
+                await client.list()
+        except (TimeoutError, httpx.ConnectError) as err:
+            # Failed setups are never unloaded, so drop the reference taken
+            # above or not-ready retries would inflate the refcount forever
+            _async_release_client(hass, settings[CONF_URL])
+            raise ConfigEntryNotReady(err) from err
+        health_cache[settings[CONF_URL]] = time.monotonic()
 
     entry.runtime_data = client
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Only spin up platforms that have at least one matching subentry; adding
+    # or removing subentries reloads the entry, so this stays in sync. Record
+    # what was forwarded so unload tears down exactly the same set.
+    subentry_types = {subentry.subentry_type for subentry in entry.subentries.values()}
+    platforms = tuple(
+        platform
+        for platform, subentry_type in _PLATFORM_SUBENTRY_TYPES.items()
+        if subentry_type in subentry_types
+    )
+    hass.data.setdefault(DOMAIN, {}).setdefault("loaded_platforms", {})[
+        entry.entry_id
+    ] = platforms
+    if platforms:
+        await hass.config_entries.async_forward_entry_setups(entry, platforms)
 
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
@@ -86,11 +186,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: OllamaConfigEntry) -> bo
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Ollama Enhanced."""
-    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    platforms = (
+        hass.data.get(DOMAIN, {})
+        .get("loaded_platforms", {})
+        .pop(entry.entry_id, PLATFORMS)
+    )
+    if platforms and not await hass.config_entries.async_unload_platforms(
+        entry, platforms
+    ):
         return False
+    _async_release_client(hass, {**entry.data, **entry.options}[CONF_URL])
+    # Only drop this entry's references to shared web search clients; other
+    # entries may still be using them, and keeping the pools warm across an
+    # options-update reload is the point of sharing them. Unreferenced
+    # clients are closed on entry removal and on shutdown.
+    domain_data = hass.data.get(DOMAIN, {})
+    web_search_refs = domain_data.get("web_search_client_refs", {})
+    for key in domain_data.get("entry_web_search_keys", {}).pop(entry.entry_id, ()):
+        if key in web_search_refs:
+            web_search_refs[key] -= 1
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove Ollama Enhanced, closing pools no other entry references."""
+    url = {**entry.data, **entry.options}.get(CONF_URL)
+    domain_data = hass.data.get(DOMAIN, {})
+    if url and domain_data.get("client_refs", {}).get(url, 0) <= 0:
+        domain_data.get("client_refs", {}).pop(url, None)
+        if (client := domain_data.get("clients", {}).pop(url, None)) is not None:
+            await client._client.aclose()  # noqa: SLF001
+
+    web_search_refs = domain_data.get("web_search_client_refs", {})
+    for subentry in entry.subentries.values():
+        if subentry.subentry_type != "conversation" or not subentry.data.get(
+            CONF_WEB_SEARCH_ENABLED, False
+        ):
+            continue
+        key = (
+            subentry.data.get(CONF_SEARCH_PROVIDER, DEFAULT_SEARCH_PROVIDER),
+            subentry.data.get(CONF_SEARCH_URL, DEFAULT_SEARCH_URL),
+        )
+        if web_search_refs.get(key, 0) <= 0:
+            web_search_refs.pop(key, None)
+            if (
+                web_search_client := domain_data.get("web_search_clients", {}).pop(
+                    key, None
+                )
+            ) is not None:
+                await web_search_client.async_close()
+
+
 async def async_update_options(hass: HomeAssistant, entry: OllamaConfigEntry) -> None:
     """Update options."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -102,19 +248,15 @@ def _add_ai_task_subentry(hass: HomeAssistant, entry: OllamaConfigEntry) -> None
     # subentry if we can find an existing model in the entry. The model
     # was removed in the previous migration step, so we need to
     # check the subentries for an existing model.
-    existing_model = next(
-        iter(
-            model
-            for subentry in entry.subentries.values()
-            if (model := subentry.data.get(CONF_MODEL)) is not None
-        ),
-        None,
-    )
+    existing_model = None
+    for subentry in entry.subentries.values():
+        if (existing_model := subentry.data.get(CONF_MODEL)) is not None:
+            break
     if existing_model:
         hass.config_entries.async_add_subentry(
             entry,
             ConfigSubentry(
-                data=MappingProxyType({CONF_MODEL: existing_model}),
+                data={CONF_MODEL: existing_model},
                 subentry_type="ai_task_data",
                 title=DEFAULT_AI_TASK_NAME,
                 unique_id=None,
@@ -2,19 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Literal
+import asyncio
+import logging
+from typing import Final, Literal
+
+import aiohttp
 
 from homeassistant.components import conversation
 from homeassistant.config_entries import ConfigSubentry
-from homeassistant.const import CONF_LLM_HASS_API, MATCH_ALL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_LLM_HASS_API, EVENT_HOMEASSISTANT_STOP, MATCH_ALL
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import OllamaConfigEntry
-from .const import CONF_PROMPT, CONF_WEB_SEARCH_ENABLED, DOMAIN
+from .const import (
+    CONF_PROMPT,
+    CONF_SEARCH_PROVIDER,
+    CONF_SEARCH_URL,
+    CONF_WEB_SEARCH_ENABLED,
+    DEFAULT_SEARCH_PROVIDER,
+    DEFAULT_SEARCH_URL,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+)
 from .entity import OllamaBaseLLMEntity
 from .web_search import WebSearchClient, format_search_results, should_trigger_search
 
+_LOGGER = logging.getLogger(__name__)
+
+_SEARCH_INSTRUCTION: Final[str] = (
+    "IMPORTANT: Use the following current web search results to inform your"
+    " response. These are real-time search results that provide current"
+    " information:\n\n"
+)
+
+# Formatted search results keyed by a hash of the result set, so follow-up
+# turns that surface the same hits skip rebuilding the multi-KB context string
+_FORMAT_CACHE: dict[int, str] = {}
+_FORMAT_CACHE_MAX_SIZE = 32
+
+
+def _format_search_results_cached(results: list[dict]) -> str:
+    """Format search results, reusing the output for identical result sets."""
+    key = hash(tuple((result.get("url"), result.get("title")) for result in results))
+    if (formatted := _FORMAT_CACHE.get(key)) is None:
+        formatted = format_search_results(results)
+        if len(_FORMAT_CACHE) >= _FORMAT_CACHE_MAX_SIZE:
+            del _FORMAT_CACHE[next(iter(_FORMAT_CACHE))]
+        _FORMAT_CACHE[key] = formatted
+    return formatted
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,8 +63,41 @@ async def async_setup_entry(
         if subentry.subentry_type != "conversation":
             continue
 
+        # Share one web search client (and its connection pool) per
+        # provider/URL combination across all conversation entities. Clients
+        # are refcounted per config entry, mirroring the Ollama clients:
+        # unload only drops references, and the pool is closed on entry
+        # removal or shutdown once nothing references it anymore.
+        web_search_client = None
+        if subentry.data.get(CONF_WEB_SEARCH_ENABLED, False):
+            domain_data = hass.data.setdefault(DOMAIN, {})
+            clients = domain_data.setdefault("web_search_clients", {})
+            refs = domain_data.setdefault("web_search_client_refs", {})
+            entry_keys = domain_data.setdefault("entry_web_search_keys", {}).setdefault(
+                config_entry.entry_id, set()
+            )
+            client_key = (
+                subentry.data.get(CONF_SEARCH_PROVIDER, DEFAULT_SEARCH_PROVIDER),
+                subentry.data.get(CONF_SEARCH_URL, DEFAULT_SEARCH_URL),
+            )
+            if (web_search_client := clients.get(client_key)) is None:
+                web_search_client = WebSearchClient(hass, subentry.data)
+                clients[client_key] = web_search_client
+
+                async def _async_close_client(
+                    _: Event, client: WebSearchClient = web_search_client
+                ) -> None:
+                    await client.async_close()
+
+                hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_STOP, _async_close_client
+                )
+            if client_key not in entry_keys:
+                entry_keys.add(client_key)
+                refs[client_key] = refs.get(client_key, 0) + 1
+
         async_add_entities(
-            [OllamaConversationEntity(config_entry, subentry)],
+            [OllamaConversationEntity(config_entry, subentry, web_search_client)],
             config_subentry_id=subentry.subentry_id,
         )
 
@@ -39,20 +109,37 @@ class OllamaConversationEntity(
 ):
     """Ollama conversation agent."""
 
+    # The base entity classes still carry a __dict__, but slotting the
+    # attributes added here keeps them out of it and makes their access a
+    # fixed-offset load on the per-message hot path
+    __slots__ = ("_llm_api", "_prompt", "_search_enabled", "_web_search_client")
+
     _attr_supports_streaming = True
+    # Class attribute rather than a per-call property; this must override the
+    # abstract supported_languages property, which has no _attr_ fallback
+    supported_languages: list[str] | Literal["*"] = MATCH_ALL
 
-    def __init__(self, entry: OllamaConfigEntry, subentry: ConfigSubentry) -> None:
+    # Bound once at class creation so the hot path avoids the module-attribute
+    # indirection on every message
+    _should_trigger_search = staticmethod(should_trigger_search)
+
+    def __init__(
+        self,
+        entry: OllamaConfigEntry,
+        subentry: ConfigSubentry,
+        web_search_client: WebSearchClient | None,
+    ) -> None:
         """Initialize the agent."""
         super().__init__(entry, subentry)
-        if self.subentry.data.get(CONF_LLM_HASS_API):
+        self._llm_api = self._settings.get(CONF_LLM_HASS_API)
+        self._prompt = self._settings.get(CONF_PROMPT)
+        if self._llm_api:
             self._attr_supported_features = (
                 conversation.ConversationEntityFeature.CONTROL
             )
 
-        # Initialize web search client if enabled
-        self._web_search_client = None
-        if self.subentry.data.get(CONF_WEB_SEARCH_ENABLED, False):
-            self._web_search_client = WebSearchClient(self.hass, self.subentry.data)
+        self._web_search_client = web_search_client
+        self._search_enabled = web_search_client is not None
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to Home Assistant."""
@@ -64,64 +151,58 @@ class OllamaConversationEntity(
         conversation.async_unset_agent(self.hass, self.entry)
         await super().async_will_remove_from_hass()
 
-    @property
-    def supported_languages(self) -> list[str] | Literal["*"]:
-        """Return a list of supported languages."""
-        return MATCH_ALL
-
     async def _async_handle_message(
         self,
         user_input: conversation.ConversationInput,
         chat_log: conversation.ChatLog,
     ) -> conversation.ConversationResult:
         """Call the API."""
-        settings = {**self.entry.data, **self.subentry.data}
-
         # Check if we should perform a web search
         search_results = None
-        import logging
-        _LOGGER = logging.getLogger(__name__)
-
-        # Debug logging
-        _LOGGER.info(f"Web search client available: {self._web_search_client is not None}")
-        _LOGGER.info(f"User input: '{user_input.text}'")
-
-        if self._web_search_client and should_trigger_search(user_input.text):
-            _LOGGER.info("Triggering web search...")
-            try:
-                search_results = await self._web_search_client.search(user_input.text)
-                _LOGGER.info(f"Search returned {len(search_results) if search_results else 0} results")
-            except Exception as e:
-                # Log error but continue with conversation
-                _LOGGER.error("Web search failed: %s", e, exc_info=True)
-        else:
-            if not self._web_search_client:
-                _LOGGER.info("Web search not enabled or client not initialized")
+        if self._search_enabled:
+            if self._should_trigger_search(user_input.text):
+                try:
+                    async with asyncio.timeout(DEFAULT_TIMEOUT):
+                        search_results = await self._web_search_client.search(
+                            user_input.text
+                        )
+                except (TimeoutError, aiohttp.ClientError, ConnectionError) as err:
+                    # Continue the conversation without search context
+                    _LOGGER.debug("Web search failed: %s", err)
+                else:
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Search returned %d results",
+                            len(search_results) if search_results else 0,
+                        )
             else:
-                _LOGGER.info("Search trigger not activated")
+                _LOGGER.debug("Search trigger not activated")
 
-        try:
-            # Prepare the context with optional search results
-            llm_context = user_input.as_llm_context(DOMAIN)
+        # The LLM context is needed even when no LLM API is selected: the chat
+        # log uses it to render the base prompt template, so it cannot be
+        # skipped for non-control conversations.
+        llm_context = user_input.as_llm_context(DOMAIN)
 
+        try:
             # Add search results to the system prompt if available
             extra_system_prompt = user_input.extra_system_prompt
             if search_results:
-                search_context = format_search_results(search_results)
-                search_instruction = "IMPORTANT: Use the following current web search results to inform your response. These are real-time search results that provide current information:\n\n"
-                full_search_context = search_instruction + search_context
-
-                if extra_system_prompt:
-                    extra_system_prompt = f"{extra_system_prompt}\n\n{full_search_context}"
-                else:
-                    extra_system_prompt = full_search_context
-
-                _LOGGER.info("Search results added to conversation context")
+                # Keep the stable prompt first and append the per-turn search
+                # context after it: Ollama reuses its server-side KV cache for
+                # a common prompt prefix, so this ordering avoids re-prefilling
+                # the persistent prompt on every turn.
+                parts = [extra_system_prompt] if extra_system_prompt else []
+                parts.append(
+                    _SEARCH_INSTRUCTION + _format_search_results_cached(search_results)
+                )
+                extra_system_prompt = "\n\n".join(parts)
+
+                _LOGGER.debug("Search results added to conversation context")
 
             await chat_log.async_provide_llm_data(
                 llm_context,
-                settings.get(CONF_LLM_HASS_API),
-                settings.get(CONF_PROMPT),
+                self._llm_api,
+                self._prompt,
                 extra_system_prompt,
             )
         except conversation.ConverseError as err:
@@ -178,6 +178,10 @@ class OllamaBaseLLMEntity(Entity):
         self.entry = entry
         self.subentry = subentry
         self._attr_unique_id = subentry.subentry_id
+        # Entry and subentry data only change via an options update, which
+        # reloads the entry and rebuilds this entity, so the merged settings
+        # can be computed once instead of on every message.
+        self._settings = {**entry.data, **subentry.data}
 
         model, _, version = subentry.data[CONF_MODEL].partition(":")
         self._attr_device_info = dr.DeviceInfo(
@@ -195,7 +199,7 @@ class OllamaBaseLLMEntity(Entity):
         structure: vol.Schema | None = None,
     ) -> None:
         """Generate an answer for the chat log."""
-        settings = {**self.entry.data, **self.subentry.data}
+        settings = self._settings
 
         client = self.entry.runtime_data
         model = settings[CONF_MODEL]
@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import io
 import json
 import logging
 import re
+import time
+from collections import OrderedDict
 from typing import Any
 
 import aiohttp
-import requests
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import quote, urlparse, urlunparse
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 try:
     from bs4 import BeautifulSoup
@@ -19,6 +29,11 @@ except ImportError:
     HAS_BEAUTIFULSOUP = False
     BeautifulSoup = None
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from homeassistant.core import HomeAssistant
 
 from .const import (
@@ -30,6 +45,102 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bound on simultaneous provider dispatches in search_all
+_MAX_CONCURRENT_SEARCHES = 8
+
+# Identical queries within the TTL are served from memory; LLM retry loops
+# commonly repeat the same search within seconds
+_QUERY_CACHE_MAX_SIZE = 256
+_QUERY_CACHE_TTL = 60  # seconds
+
+# Precompiled patterns for the regex HTML fallback and the DuckDuckGo JSONP
+# unwrapping, so hot loops don't re-consult the re module's pattern cache
+_RESULT_RE = re.compile(
+    r'<(?:article|div)[^>]*class="[^"]*result[^"]*"[^>]*>(.*?)</(?:article|div)>',
+    re.DOTALL | re.IGNORECASE,
+)
+_TITLE_RES = tuple(
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        r'<h[23][^>]*>.*?<a[^>]*href="([^"]*)"[^>]*>([^<]*)</a>.*?</h[23]>',
+        r'<a[^>]*href="([^"]*)"[^>]*class="[^"]*title[^"]*"[^>]*>([^<]*)</a>',
+        r'<a[^>]*href="([^"]*)"[^>]*>([^<]*)</a>',
+    )
+)
+_CONTENT_RES = tuple(
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        r'<p[^>]*class="[^"]*content[^"]*"[^>]*>([^<]*)</p>',
+        r'<p[^>]*>([^<]*)</p>',
+        r'<span[^>]*>([^<]*)</span>',
+    )
+)
+_STRIP_TAGS_RE = re.compile(r'<[^>]*>')
+_JSONP_RE = re.compile(r'ddg_spice_\w+\((.*)\);?$')
+
+# Maximum snippet length shown to the model
+_SNIPPET_LENGTH = 300
+
+# Fixed SearXNG request parts; only the query varies per call
+_SEARXNG_BASE_PARAMS: dict[str, str] = {
+    "format": "json",
+    "pageno": "1",
+    "safesearch": "1",
+    "language": "en-US",
+    "time_range": "",
+    "categories": "",
+    "theme": "simple",
+    "image_proxy": "0",
+}
+_SEARXNG_HEADERS = {
+    "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
+    "Accept": "text/html",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+}
+
+# Hostname prefixes that identify private/loopback addresses, including the
+# full 172.16.0.0/12 range
+_LOCAL_HOST_PREFIXES = (
+    "localhost",
+    "127.",
+    "192.168.",
+    "10.",
+    *(f"172.{octet}." for octet in range(16, 32)),
+)
+
+
+def _make_snippet(content: str) -> str:
+    """Truncate content to a display snippet."""
+    if len(content) > _SNIPPET_LENGTH:
+        return content[:_SNIPPET_LENGTH] + "..."
+    return content
+
+
+def _build_result(title: str, url: str, text: str) -> dict[str, Any]:
+    """Build a normalized result entry, computing the snippet once."""
+    return {
+        "title": title,
+        "url": url,
+        "content": text,
+        "snippet": _make_snippet(text),
+    }
+
+
+if HAS_LXML:
+    # Compiled once at import; libxml2 walks the tree in C instead of
+    # traversing it element by element in Python
+    _ARTICLES_XPATH = etree.XPath(
+        "//article[contains(@class, 'result')] | //div[contains(@class, 'result')]"
+    )
+    # Ordered by preference, mirroring the BeautifulSoup fallback selectors
+    _TITLE_XPATHS = tuple(etree.XPath(p) for p in (".//h3//a", ".//h2//a", ".//a"))
+    _CONTENT_XPATHS = tuple(
+        etree.XPath(p)
+        for p in (".//p[contains(@class, 'content')]", ".//p", ".//span")
+    )
+
 
 class WebSearchClient:
     """Web search client supporting multiple providers."""
@@ -40,6 +151,48 @@ class WebSearchClient:
         self.provider = config.get(CONF_SEARCH_PROVIDER, "searxng")
         self.base_url = self._normalize_url(config.get(CONF_SEARCH_URL, "http://localhost:8080"))
         self.results_count = int(config.get(CONF_SEARCH_RESULTS_COUNT, DEFAULT_SEARCH_RESULTS_COUNT))
+        # base_url never changes after init, so the search endpoint is fixed
+        self._searxng_url = self._build_searxng_url(self.base_url)
+        self._session: aiohttp.ClientSession | None = None
+        self._query_cache: OrderedDict[
+            tuple[str, str, int], tuple[float, list[dict[str, Any]]]
+        ] = OrderedDict()
+        self._query_futures: dict[
+            tuple[str, str, int], asyncio.Future[list[dict[str, Any]]]
+        ] = {}
+        self._providers = {
+            "searxng": self._search_searxng,
+            "duckduckgo": self._search_duckduckgo,
+            "wikipedia": self._search_wikipedia,
+            "google": self._search_google,
+            "bing": self._search_bing,
+            "custom": self._search_custom,
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        One long-lived session keeps connections alive and caches DNS across
+        searches instead of paying a handshake per query.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=8,
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL to ensure it has proper protocol."""
@@ -51,39 +204,99 @@ class WebSearchClient:
 
         # Add protocol if missing
         if not url.startswith(('http://', 'https://')):
-            # Default to http for local addresses, https for external
-            if any(local in url for local in ['localhost', '127.0.0.1', '192.168.', '10.', '172.']):
+            # Default to http for local addresses, https for external.
+            # Parsing with a dummy scheme makes bare hosts resolve to a
+            # hostname, and the prefix check only matches the actual host
+            # rather than anywhere in the URL.
+            hostname = urlparse(f"//{url}").hostname or ""
+            if hostname.startswith(_LOCAL_HOST_PREFIXES):
                 url = f"http://{url}"
             else:
                 url = f"https://{url}"
 
         return url
 
+    async def _dispatch(self, provider: str, query: str) -> list[dict[str, Any]]:
+        """Run a search against a single provider."""
+        if (search := self._providers.get(provider)) is None:
+            _LOGGER.error("Unknown search provider: %s", provider)
+            return []
+        return await search(query)
+
     async def search(self, query: str) -> list[dict[str, Any]]:
         """Perform a web search and return results."""
+        key = (self.provider, query.strip().lower(), self.results_count)
+
+        if (cached := self._query_cache.get(key)) is not None:
+            timestamp, results = cached
+            if time.monotonic() - timestamp < _QUERY_CACHE_TTL:
+                self._query_cache.move_to_end(key)
+                _LOGGER.debug("Query cache hit for '%s'", query)
+                return list(results)
+            del self._query_cache[key]
+
+        # Single-flight: concurrent identical queries await the in-flight
+        # search instead of starting another HTTP round trip
+        if (future := self._query_futures.get(key)) is not None:
+            return list(await future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._query_futures[key] = future
+        results: list[dict[str, Any]] = []
         try:
-            if self.provider == "searxng":
-                return await self._search_searxng(query)
-            elif self.provider == "duckduckgo":
-                return await self._search_duckduckgo(query)
-            elif self.provider == "wikipedia":
-                return await self._search_wikipedia(query)
-            elif self.provider == "google":
-                return await self._search_google(query)
-            elif self.provider == "bing":
-                return await self._search_bing(query)
-            elif self.provider == "custom":
-                return await self._search_custom(query)
-            else:
-                _LOGGER.error("Unknown search provider: %s", self.provider)
-                return []
-        except Exception as e:
-            _LOGGER.error("Search failed: %s", e)
-            return []
+            try:
+                results = await self._dispatch(self.provider, query)
+            except Exception as e:
+                _LOGGER.error("Search failed: %s", e)
+        finally:
+            self._query_futures.pop(key, None)
+            if not future.done():
+                future.set_result(results)
+
+        if results:
+            if len(self._query_cache) >= _QUERY_CACHE_MAX_SIZE:
+                self._query_cache.popitem(last=False)
+            self._query_cache[key] = (time.monotonic(), results)
+        return results
+
+    async def search_all(
+        self, query: str, providers: list[str]
+    ) -> list[dict[str, Any]]:
+        """Search multiple providers concurrently and merge their results.
+
+        Fanning out with gather makes the wall-clock cost the slowest
+        provider instead of the sum of all of them. Results are de-duplicated
+        by URL, keeping provider order.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+
+        async def _bounded_dispatch(provider: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._dispatch(provider, query)
+
+        outcomes = await asyncio.gather(
+            *(_bounded_dispatch(provider) for provider in providers),
+            return_exceptions=True,
+        )
 
-    async def _search_searxng(self, query: str) -> list[dict[str, Any]]:
-        """Search SearXNG mirroring OpenWebUI's integration."""
-        search_url = self.base_url.rstrip("/")
+        merged: list[dict[str, Any]] = []
+        seen_urls: set[str] = set()
+        for provider, outcome in zip(providers, outcomes):
+            if isinstance(outcome, BaseException):
+                _LOGGER.error("Search via %s failed: %s", provider, outcome)
+                continue
+            for result in outcome:
+                if (url := result.get("url")) and url in seen_urls:
+                    continue
+                if url:
+                    seen_urls.add(url)
+                merged.append(result)
+        return merged
+
+    @staticmethod
+    def _build_searxng_url(base_url: str) -> str:
+        """Normalize the configured base URL into the SearXNG search endpoint."""
+        search_url = base_url.rstrip("/")
 
         # Support legacy URLs that embed the query placeholder
         if "<query>" in search_url:
@@ -101,86 +314,60 @@ class WebSearchClient:
                 normalized_path = "/search"
             parsed_url = parsed_url._replace(path=normalized_path)
 
-        search_url = urlunparse(parsed_url)
-
-        params: dict[str, Any] = {
-            "q": query,
-            "format": "json",
-            "pageno": 1,
-            "safesearch": "1",
-            "language": "en-US",
-            "time_range": "",
-            "categories": "",
-            "theme": "simple",
-            "image_proxy": 0,
-        }
+        return urlunparse(parsed_url)
 
-        headers = {
-            "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
-        }
+    async def _search_searxng(self, query: str) -> list[dict[str, Any]]:
+        """Search SearXNG mirroring OpenWebUI's integration."""
+        search_url = self._searxng_url
+        params = {"q": query, **_SEARXNG_BASE_PARAMS}
 
         _LOGGER.debug("Executing SearXNG search at %s", search_url)
 
-        def _perform_request() -> tuple[int, Any]:
-            try:
-                response = requests.get(
-                    search_url,
-                    headers=headers,
-                    params=params,
-                    timeout=15,
-                )
-            except requests.RequestException as err:
-                raise RuntimeError(f"Request error: {err}") from err
-
-            return response.status_code, response
-
+        session = self._get_session()
         try:
-            if self.hass is not None:
-                status, response = await self.hass.async_add_executor_job(_perform_request)
-            else:
-                status, response = await asyncio.to_thread(_perform_request)
-        except RuntimeError as err:
-            _LOGGER.error("SearXNG request failed: %s", err)
-            return []
-        except Exception as err:  # pragma: no cover - safety net
-            _LOGGER.exception("Unexpected error during SearXNG search: %s", err)
-            return []
+            async with session.get(
+                search_url,
+                headers=_SEARXNG_HEADERS,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=15),
+            ) as response:
+                # Read the body once as bytes; JSON parsing and the lxml HTML
+                # fallback both accept bytes directly, so decoding to str only
+                # happens on the paths that actually need it.
+                raw = await response.read()
+                if response.status != 200:
+                    _LOGGER.error(
+                        "SearXNG search failed with status %s: %s",
+                        response.status,
+                        raw[:500].decode("utf-8", "replace"),
+                    )
+                    return []
 
-        if status != 200:
-            body_preview = response.text[:500]
-            _LOGGER.error(
-                "SearXNG search failed with status %s: %s",
-                status,
-                body_preview,
-            )
+                try:
+                    data = _json_loads(raw)
+                except ValueError:
+                    _LOGGER.debug("Falling back to HTML parsing for SearXNG response")
+                    return self._parse_searxng_html(raw)
+        except aiohttp.ClientError as err:
+            _LOGGER.error("SearXNG request failed: %s", err)
             return []
 
-        try:
-            data = response.json()
-        except ValueError:
-            html_content = response.text
-            _LOGGER.debug("Falling back to HTML parsing for SearXNG response")
-            return self._parse_searxng_html(html_content)
-
         results = data.get("results", []) if isinstance(data, dict) else []
         if not isinstance(results, list):
             _LOGGER.error("SearXNG results field missing or invalid")
             return []
 
-        sorted_results = sorted(
+        # O(N log k) selection of the top hits instead of sorting everything
+        top_results = heapq.nlargest(
+            self.results_count,
             results,
             key=lambda item: item.get("score", 0) or 0,
-            reverse=True,
         )
 
         limited_results = []
-        for item in sorted_results[: int(self.results_count)]:
+        for item in top_results:
             content = item.get("content", "") or ""
-            snippet = content[:300] + "..." if len(content) > 300 else content
+            snippet = _make_snippet(content)
             limited_results.append(
                 {
                     "title": item.get("title", "") or "",
@@ -195,8 +382,14 @@ class WebSearchClient:
 
         return limited_results
 
-    def _parse_searxng_html(self, html_content: str) -> list[dict[str, Any]]:
+    def _parse_searxng_html(self, html_content: str | bytes) -> list[dict[str, Any]]:
         """Parse search results from SearXNG HTML."""
+        if HAS_LXML:
+            if isinstance(html_content, bytes):
+                return self._parse_searxng_html_stream(html_content)
+            return self._parse_searxng_html_lxml(html_content)
+        if isinstance(html_content, bytes):
+            html_content = html_content.decode("utf-8", "replace")
         if not HAS_BEAUTIFULSOUP:
             _LOGGER.warning("BeautifulSoup not available, using regex parsing fallback")
             return self._parse_searxng_html_regex(html_content)
@@ -213,10 +406,10 @@ class WebSearchClient:
                 if not articles:
                     articles = soup.select('.result')
 
-            _LOGGER.info(f"Found {len(articles)} article elements")
+            _LOGGER.debug("Found %d article elements", len(articles))
 
             # Limit articles to process
-            max_articles = int(min(len(articles), self.results_count))
+            max_articles = min(len(articles), self.results_count)
             for i in range(max_articles):
                 article = articles[i]
                 try:
@@ -253,11 +446,7 @@ class WebSearchClient:
                     if content_elem:
                         content = content_elem.get_text(strip=True)
 
-                    # Create snippet safely
-                    if content and len(content) > 300:
-                        snippet = content[:300] + "..."
-                    else:
-                        snippet = content
+                    snippet = _make_snippet(content)
 
                     if title:  # Only add if we have at least a title
                         results.append({
@@ -268,32 +457,131 @@ class WebSearchClient:
                         })
 
                 except Exception as e:
-                    _LOGGER.debug(f"Error parsing individual search result {i}: {e}")
+                    _LOGGER.debug("Error parsing individual search result %d: %s", i, e)
                     continue
 
-            _LOGGER.info(f"Successfully parsed {len(results)} results")
+            _LOGGER.debug("Successfully parsed %d results", len(results))
             return results
 
-        except Exception as e:
-            _LOGGER.error(f"Error parsing SearXNG HTML: {e}")
-            import traceback
-            _LOGGER.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            _LOGGER.exception("Error parsing SearXNG HTML")
+            return []
+
+    def _parse_searxng_html_stream(self, html_bytes: bytes) -> list[dict[str, Any]]:
+        """Stream-parse SearXNG HTML bytes, stopping once enough results.
+
+        iterparse keeps only the current subtree alive and the loop breaks as
+        soon as results_count articles are collected, so a large response
+        retains O(k) memory instead of a full DOM. Falls back to the full
+        lxml parse when no article elements are present (older SearXNG themes
+        emit div-based results).
+        """
+        results: list[dict[str, Any]] = []
+        try:
+            for _event, elem in etree.iterparse(
+                io.BytesIO(html_bytes), html=True, tag="article", events=("end",)
+            ):
+                if "result" in (elem.get("class") or ""):
+                    title = ""
+                    url = ""
+                    for xpath in _TITLE_XPATHS:
+                        if links := xpath(elem):
+                            title = "".join(links[0].itertext()).strip()
+                            url = links[0].get("href", "")
+                            break
+
+                    if title:
+                        content = ""
+                        for xpath in _CONTENT_XPATHS:
+                            if elements := xpath(elem):
+                                content = "".join(elements[0].itertext()).strip()
+                                break
+
+                        snippet = _make_snippet(content)
+                        results.append({
+                            "title": title,
+                            "url": url,
+                            "content": content,
+                            "snippet": snippet,
+                        })
+                        if len(results) >= self.results_count:
+                            break
+
+                # Canonical lxml low-memory pattern: drop the processed
+                # subtree and any fully-parsed preceding siblings
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        except (etree.ParserError, etree.XMLSyntaxError, ValueError):
+            _LOGGER.exception("Error stream-parsing SearXNG HTML")
+            return results
+
+        if not results:
+            return self._parse_searxng_html_lxml(html_bytes)
+
+        _LOGGER.debug("Successfully stream-parsed %d results", len(results))
+        return results
+
+    def _parse_searxng_html_lxml(self, html_content: str | bytes) -> list[dict[str, Any]]:
+        """Parse search results from SearXNG HTML using lxml/XPath."""
+        try:
+            doc = lxml_html.fromstring(html_content)
+        except (etree.ParserError, ValueError):
+            _LOGGER.exception("Error parsing SearXNG HTML")
             return []
 
+        results: list[dict[str, Any]] = []
+        articles = _ARTICLES_XPATH(doc)
+        _LOGGER.debug("Found %d article elements", len(articles))
+
+        for article in articles:
+            # Extract title and URL from the first matching title link
+            title = ""
+            url = ""
+            for xpath in _TITLE_XPATHS:
+                if links := xpath(article):
+                    title = links[0].text_content().strip()
+                    url = links[0].get("href", "")
+                    break
+
+            if not title:
+                continue
+
+            # Extract content/snippet
+            content = ""
+            for xpath in _CONTENT_XPATHS:
+                if elements := xpath(article):
+                    content = elements[0].text_content().strip()
+                    break
+
+            snippet = _make_snippet(content)
+            results.append({
+                "title": title,
+                "url": url,
+                "content": content,
+                "snippet": snippet,
+            })
+            if len(results) >= self.results_count:
+                break
+
+        _LOGGER.debug("Successfully parsed %d results", len(results))
+        return results
+
     def _parse_searxng_html_regex(self, html_content: str) -> list[dict[str, Any]]:
         """Parse search results from SearXNG HTML using regex as fallback."""
         try:
             results = []
 
             # Look for result articles or divs
-            result_pattern = r'<(?:article|div)[^>]*class="[^"]*result[^"]*"[^>]*>(.*?)</(?:article|div)>'
-            result_matches = re.findall(result_pattern, html_content, re.DOTALL | re.IGNORECASE)
+            result_matches = _RESULT_RE.findall(html_content)
 
-            _LOGGER.info(f"Found {len(result_matches)} result blocks with regex")
+            _LOGGER.debug("Found %d result blocks with regex", len(result_matches))
 
             count = 0
             for match in result_matches:
-                if count >= int(self.results_count):
+                if count >= self.results_count:
                     break
 
                 try:
@@ -302,17 +590,11 @@ class WebSearchClient:
                     url = ""
 
                     # Look for title in h3 or h2 with link
-                    title_patterns = [
-                        r'<h[23][^>]*>.*?<a[^>]*href="([^"]*)"[^>]*>([^<]*)</a>.*?</h[23]>',
-                        r'<a[^>]*href="([^"]*)"[^>]*class="[^"]*title[^"]*"[^>]*>([^<]*)</a>',
-                        r'<a[^>]*href="([^"]*)"[^>]*>([^<]*)</a>'
-                    ]
-
-                    for pattern in title_patterns:
-                        title_match = re.search(pattern, match, re.DOTALL | re.IGNORECASE)
+                    for pattern in _TITLE_RES:
+                        title_match = pattern.search(match)
                         if title_match:
                             url = title_match.group(1).strip()
-                            title = re.sub(r'<[^>]*>', '', title_match.group(2)).strip()
+                            title = _STRIP_TAGS_RE.sub('', title_match.group(2)).strip()
                             break
 
                     if not title:
@@ -320,23 +602,13 @@ class WebSearchClient:
 
                     # Extract content/snippet
                     content = ""
-                    content_patterns = [
-                        r'<p[^>]*class="[^"]*content[^"]*"[^>]*>([^<]*)</p>',
-                        r'<p[^>]*>([^<]*)</p>',
-                        r'<span[^>]*>([^<]*)</span>'
-                    ]
-
-                    for pattern in content_patterns:
-                        content_match = re.search(pattern, match, re.DOTALL | re.IGNORECASE)
+                    for pattern in _CONTENT_RES:
+                        content_match = pattern.search(match)
                         if content_match:
-                            content = re.sub(r'<[^>]*>', '', content_match.group(1)).strip()
+                            content = _STRIP_TAGS_RE.sub('', content_match.group(1)).strip()
                             break
 
-                    # Create snippet safely
-                    if content and len(content) > 300:
-                        snippet = content[:300] + "..."
-                    else:
-                        snippet = content
+                    snippet = _make_snippet(content)
 
                     results.append({
                         "title": title,
@@ -347,14 +619,14 @@ class WebSearchClient:
                     count += 1
 
                 except Exception as e:
-                    _LOGGER.debug(f"Error parsing result with regex: {e}")
+                    _LOGGER.debug("Error parsing result with regex: %s", e)
                     continue
 
-            _LOGGER.info(f"Successfully parsed {len(results)} results with regex")
+            _LOGGER.debug("Successfully parsed %d results with regex", len(results))
             return results
 
-        except Exception as e:
-            _LOGGER.error(f"Error parsing SearXNG HTML with regex: {e}")
+        except Exception:
+            _LOGGER.exception("Error parsing SearXNG HTML with regex")
             return []
 
     async def _search_duckduckgo(self, query: str) -> list[dict[str, Any]]:
@@ -374,66 +646,60 @@ class WebSearchClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers, timeout=10) as response:
-                    if response.status == 200:
-                        # Handle both JSON and JSONP responses
-                        content_type = response.headers.get('content-type', '')
-                        text_response = await response.text()
-
-                        # If it's JSONP (JavaScript), extract the JSON part
-                        if 'javascript' in content_type or text_response.strip().startswith('ddg_spice_'):
-                            # Extract JSON from JSONP callback
-                            import re
-                            json_match = re.search(r'ddg_spice_\w+\((.*)\);?$', text_response.strip())
-                            if json_match:
-                                json_str = json_match.group(1)
-                                data = json.loads(json_str)
-                            else:
-                                _LOGGER.warning("Could not extract JSON from JSONP response")
-                                return self._create_fallback_result(query)
+            session = self._get_session()
+            async with session.get(url, params=params, headers=headers, timeout=10) as response:
+                if response.status == 200:
+                    # Handle both JSON and JSONP responses
+                    content_type = response.headers.get('content-type', '')
+                    text_response = await response.text()
+
+                    # If it's JSONP (JavaScript), extract the JSON part
+                    if 'javascript' in content_type or text_response.strip().startswith('ddg_spice_'):
+                        # Extract JSON from JSONP callback
+                        json_match = _JSONP_RE.search(text_response.strip())
+                        if json_match:
+                            json_str = json_match.group(1)
+                            data = _json_loads(json_str)
                         else:
-                            # Regular JSON response
-                            data = json.loads(text_response)
-
-                        results = []
-
-                        # Extract results from various DuckDuckGo response fields
-                        if data.get("Abstract"):
-                            results.append({
-                                "title": data.get("Heading", query),
-                                "url": data.get("AbstractURL", ""),
-                                "content": data.get("Abstract", ""),
-                                "snippet": data.get("Abstract", "")[:300] + "..." if len(data.get("Abstract", "")) > 300 else data.get("Abstract", ""),
-                            })
-
-                        # Add related topics
-                        for topic in data.get("RelatedTopics", [])[:self.results_count-1]:
-                            if isinstance(topic, dict) and topic.get("Text"):
-                                results.append({
-                                    "title": topic.get("Text", "").split(" - ")[0] if " - " in topic.get("Text", "") else topic.get("Text", ""),
-                                    "url": topic.get("FirstURL", ""),
-                                    "content": topic.get("Text", ""),
-                                    "snippet": topic.get("Text", "")[:300] + "..." if len(topic.get("Text", "")) > 300 else topic.get("Text", ""),
-                                })
-
-                        # If no results from DDG API, create a synthetic result
-                        if not results:
+                            _LOGGER.warning("Could not extract JSON from JSONP response")
                             return self._create_fallback_result(query)
-
-                        return results[:self.results_count]
                     else:
-                        _LOGGER.error("DuckDuckGo search failed with status: %s", response.status)
+                        # Regular JSON response
+                        data = _json_loads(text_response)
+
+                    results = []
+
+                    # Extract results from various DuckDuckGo response fields
+                    if abstract := data.get("Abstract"):
+                        results.append(_build_result(
+                            data.get("Heading", query),
+                            data.get("AbstractURL", ""),
+                            abstract,
+                        ))
+
+                    # Add related topics
+                    for topic in data.get("RelatedTopics", [])[:self.results_count-1]:
+                        if isinstance(topic, dict) and (text := topic.get("Text")):
+                            results.append(_build_result(
+                                text.partition(" - ")[0],
+                                topic.get("FirstURL", ""),
+                                text,
+                            ))
+
+                    # If no results from DDG API, create a synthetic result
+                    if not results:
                         return self._create_fallback_result(query)
+
+                    return results[:self.results_count]
+                else:
+                    _LOGGER.error("DuckDuckGo search failed with status: %s", response.status)
+                    return self._create_fallback_result(query)
         except Exception as e:
             _LOGGER.error("DuckDuckGo search error: %s", e)
             return self._create_fallback_result(query)
 
     async def _search_wikipedia(self, query: str) -> list[dict[str, Any]]:
         """Search using Wikipedia API."""
-        url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
-
-        # First, search for the page
         search_url = "https://en.wikipedia.org/w/api.php"
         search_params = {
             "action": "query",
@@ -448,31 +714,52 @@ class WebSearchClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # Search for relevant pages
-                async with session.get(search_url, params=search_params, headers=headers, timeout=10) as response:
+            session = self._get_session()
+            # Search for relevant pages
+            async with session.get(search_url, params=search_params, headers=headers, timeout=10) as response:
+                if response.status != 200:
+                    _LOGGER.error("Wikipedia search failed with status: %s", response.status)
+                    return self._create_fallback_result(query)
+                search_data = await response.json(loads=_json_loads, content_type=None)
+
+            items = search_data.get("query", {}).get("search", [])[:self.results_count]
+            if not items:
+                return self._create_fallback_result(query)
+
+            # Fetch the intro extracts for all pages in one batched call;
+            # they come back as plain text, so no per-row HTML cleanup
+            extracts: dict[str, str] = {}
+            pageids = [str(item["pageid"]) for item in items if "pageid" in item]
+            if pageids:
+                extract_params = {
+                    "action": "query",
+                    "format": "json",
+                    "prop": "extracts",
+                    "exintro": "1",
+                    "explaintext": "1",
+                    "pageids": "|".join(pageids),
+                }
+                async with session.get(search_url, params=extract_params, headers=headers, timeout=10) as response:
                     if response.status == 200:
-                        search_data = await response.json()
-                        results = []
-
-                        for item in search_data.get("query", {}).get("search", [])[:self.results_count]:
-                            title = item.get("title", "")
-                            snippet = item.get("snippet", "").replace("<span class=\"searchmatch\">", "").replace("</span>", "")
-
-                            results.append({
-                                "title": title,
-                                "url": f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
-                                "content": snippet,
-                                "snippet": snippet[:300] + "..." if len(snippet) > 300 else snippet,
-                            })
-
-                        if results:
-                            return results
-                        else:
-                            return self._create_fallback_result(query)
-                    else:
-                        _LOGGER.error("Wikipedia search failed with status: %s", response.status)
-                        return self._create_fallback_result(query)
+                        extract_data = await response.json(loads=_json_loads, content_type=None)
+                        pages = extract_data.get("query", {}).get("pages", {})
+                        extracts = {
+                            pageid: page.get("extract", "")
+                            for pageid, page in pages.items()
+                        }
+
+            results = []
+            for item in items:
+                title = item.get("title", "")
+                text = extracts.get(str(item.get("pageid", ""))) or _STRIP_TAGS_RE.sub(
+                    "", item.get("snippet", "")
+                )
+                results.append(_build_result(
+                    title,
+                    f"https://en.wikipedia.org/wiki/{quote(title.replace(' ', '_'))}",
+                    text,
+                ))
+            return results
         except Exception as e:
             _LOGGER.error("Wikipedia search error: %s", e)
             return self._create_fallback_result(query)
@@ -499,28 +786,31 @@ class WebSearchClient:
             "format": "json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=10) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    results = []
-
-                    # Try to parse common response formats
-                    items = data.get("results", data.get("items", data.get("data", [])))
-
-                    for item in items[:self.results_count]:
-                        results.append({
-                            "title": item.get("title", item.get("name", "")),
-                            "url": item.get("url", item.get("link", "")),
-                            "content": item.get("content", item.get("snippet", item.get("description", ""))),
-                            "snippet": (item.get("content", item.get("snippet", item.get("description", "")))[:300] + "...")
-                                      if len(item.get("content", item.get("snippet", item.get("description", "")))) > 300
-                                      else item.get("content", item.get("snippet", item.get("description", ""))),
-                        })
-                    return results
-                else:
-                    _LOGGER.error("Custom search failed with status: %s", response.status)
-                    return []
+        session = self._get_session()
+        async with session.get(url, params=params, timeout=10) as response:
+            if response.status == 200:
+                data = await response.json(loads=_json_loads, content_type=None)
+                results = []
+
+                # Try to parse common response formats
+                items = data.get("results", data.get("items", data.get("data", [])))
+
+                for item in items[:self.results_count]:
+                    text = (
+                        item.get("content")
+                        or item.get("snippet")
+                        or item.get("description")
+                        or ""
+                    )
+                    results.append(_build_result(
+                        item.get("title", item.get("name", "")),
+                        item.get("url", item.get("link", "")),
+                        text,
+                    ))
+                return results
+            else:
+                _LOGGER.error("Custom search failed with status: %s", response.status)
+                return []
 
     def _create_fallback_result(self, query: str) -> list[dict[str, Any]]:
         """Create a fallback result when search APIs fail."""
@@ -552,38 +842,51 @@ def format_search_results(results: list[dict[str, Any]]) -> str:
     return "\n".join(formatted)
 
 
+_SEARCH_TRIGGERS = (
+    "search for",
+    "look up",
+    "find information about",
+    "what is",
+    "what are",
+    "tell me about",
+    "latest news",
+    "current events",
+    "recent",
+    "news",
+    "updates",
+    "today",
+    "this week",
+    "this month",
+    "this year",
+    "2024",
+    "2025",
+    "latest",
+    "current",
+    "new",
+    "happening",
+)
+
+
+# Most conversation inputs are short device commands ("turn off kitchen")
+# that never warrant a web search; filter those out before scanning for
+# trigger phrases.
+_MIN_SEARCH_MESSAGE_LENGTH = 15
+_COMMAND_PREFIXES = ("turn ", "set ", "open ", "close ", "play ", "pause ", "stop ")
+
+# One alternation scans the message in a single C-level pass instead of one
+# substring search per trigger phrase
+_TRIGGER_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(trigger) for trigger in _SEARCH_TRIGGERS) + r")\b",
+    re.IGNORECASE,
+)
+
+
 def should_trigger_search(message: str) -> bool:
     """Determine if a message should trigger a web search."""
-    search_triggers = [
-        "search for",
-        "look up",
-        "find information about",
-        "what is",
-        "what are",
-        "tell me about",
-        "latest news",
-        "current events",
-        "recent",
-        "news",
-        "updates",
-        "today",
-        "this week",
-        "this month",
-        "this year",
-        "2024",
-        "2025",
-        "latest",
-        "current",
-        "new",
-        "happening",
-    ]
-
-    message_lower = message.lower()
-    triggered = any(trigger in message_lower for trigger in search_triggers)
-
-    # Log for debugging
-    import logging
-    _LOGGER = logging.getLogger(__name__)
-    _LOGGER.info(f"Search trigger check for '{message}': {triggered}")
-
+    if len(message) < _MIN_SEARCH_MESSAGE_LENGTH:
+        return False
+    if message.lower().startswith(_COMMAND_PREFIXES):
+        return False
+    triggered = _TRIGGER_RE.search(message) is not None
+    _LOGGER.debug("Search trigger check for '%s': %s", message, triggered)
     return triggered